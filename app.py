@@ -2,12 +2,23 @@ import os
 import re
 import argparse
 import tempfile
+import io
 import time
 import shutil
 import subprocess
 import sys
+import queue
+import threading
 import platform
-from PyPDF2 import PdfReader
+import collections
+import itertools
+import multiprocessing
+import concurrent.futures
+import hashlib
+import pathlib
+import fitz
+import requests
+import gtts.tts
 from gtts import gTTS
 from pydub import AudioSegment
 from tqdm import tqdm
@@ -19,12 +30,83 @@ import logging
 logging.basicConfig(filename='pdf_to_audiobook.log', level=logging.ERROR,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Number of concurrent gTTS requests
+MAX_TTS_WORKERS = 16
+
+# On-disk cache of synthesized chunks, keyed by language and text
+if platform.system() == "Windows":
+    CACHE_DIR = pathlib.Path(os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))) / "pdf_to_audiobook"
+else:
+    CACHE_DIR = pathlib.Path(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))) / "pdf_to_audiobook"
+CACHE_MAX_BYTES = 500 * 1024 * 1024
+FFMPEG_PATH_FILE = CACHE_DIR / "ffmpeg_path.txt"
+
+# Maximum characters per chunk sent to gTTS
+DEFAULT_CHUNK_CHARS = 1000
+
+# Characters that end a sentence, used to pick chunk split points
+_SENTENCE_BOUNDARIES = ('.', '!', '?', ';', '\n', '。', '！', '？', '；')
+
+# Minimum number of pages per worker process when extracting PDF text
+PARALLEL_EXTRACT_MIN_PAGES = 50
+
+# Text cleaning patterns used by clean_text
+_NONPRINT_RE = re.compile(r'[^\x20-\x7E]+')
+_PAGE_RE = re.compile(r'\bPage \d+\b')
+
+
+class _KeepAliveSession(requests.Session):
+    """requests session that stays open across ``with`` blocks so connections are reused"""
+
+    def __exit__(self, *args):
+        pass
+
+
+class _SharedSessionRequests:
+    """Stand-in for the requests module inside gtts.tts that hands out per-thread keep-alive sessions"""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def Session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = _KeepAliveSession()
+        return session
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+# gTTS opens a new session (and TLS connection) per request; reuse one per worker thread instead
+gtts.tts.requests = _SharedSessionRequests()
+
+
+def remember_ffmpeg_path(path):
+    """Saves the discovered ffmpeg path so later runs can skip the search"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        FFMPEG_PATH_FILE.write_text(path, encoding="utf-8")
+    except OSError as e:
+        logging.warning(f"Failed to save ffmpeg path: {str(e)}")
+
 
 # Set ffmpeg path if not in system PATH
 def setup_ffmpeg():
     """Ensure ffmpeg is available for pydub"""
+    # Reuse the path found on a previous run while it is still valid
+    try:
+        cached_path = FFMPEG_PATH_FILE.read_text(encoding="utf-8").strip()
+        if cached_path and os.access(cached_path, os.X_OK):
+            AudioSegment.converter = cached_path
+            return True
+    except OSError:
+        pass
+
     # First check if ffmpeg is in system PATH
-    if shutil.which("ffmpeg"):
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path:
+        remember_ffmpeg_path(ffmpeg_path)
         return True
 
     # Try to find in common installation paths
@@ -50,6 +132,7 @@ def setup_ffmpeg():
     for path in common_paths:
         if os.path.exists(path):
             AudioSegment.converter = path
+            remember_ffmpeg_path(path)
             return True
 
     return False
@@ -59,160 +142,324 @@ def setup_ffmpeg():
 FFMPEG_AVAILABLE = setup_ffmpeg()
 
 
-def extract_text_from_pdf(pdf_path):
-    """Extracts text from a PDF file"""
+def _extract_page_range(pdf_path, start, stop, clean=False):
+    """Extracts (and optionally cleans) text from pages [start, stop) of a PDF file"""
+    text = ""
+    with fitz.open(pdf_path) as doc:
+        for page_number in range(start, stop):
+            page_text = doc.load_page(page_number).get_text()
+            if page_text:
+                text += page_text + "\n"
+    return clean_text(text) if clean else text
+
+
+def _join_cleaned(parts):
+    """Joins separately cleaned pieces of text as if they had been cleaned together"""
     text = ""
+    for part in parts:
+        if not part:
+            continue
+        # clean_text collapses whitespace to one space, except around hyphens
+        if text and not (text.endswith('-') or part.startswith('-')):
+            text += ' '
+        text += part
+    return text
+
+
+def extract_text_from_pdf(pdf_path, clean=False):
+    """Extracts text from a PDF file, cleaning it with clean_text if requested"""
     try:
-        with open(pdf_path, "rb") as file:
-            reader = PdfReader(file)
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+        with fitz.open(pdf_path) as doc:
+            page_count = doc.page_count
+
+        # Small documents are faster to read serially than to hand off to worker processes
+        workers = min(os.cpu_count() or 1, page_count // PARALLEL_EXTRACT_MIN_PAGES)
+        if workers <= 1:
+            return _extract_page_range(pdf_path, 0, page_count, clean)
+
+        # PyMuPDF documents can't be shared between threads, so each worker
+        # process opens the file itself and extracts a contiguous page range.
+        # Cleaning is CPU-bound too, so it runs in the same workers.
+        batch_size = -(-page_count // workers)
+        starts = range(0, page_count, batch_size)
+        stops = [min(start + batch_size, page_count) for start in starts]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            texts = executor.map(_extract_page_range, [pdf_path] * len(starts), starts, stops,
+                                 [clean] * len(starts))
+            return _join_cleaned(texts) if clean else "".join(texts)
     except Exception as e:
         error_msg = f"PDF extraction failed: {str(e)}"
         logging.error(error_msg)
         raise RuntimeError(error_msg)
-    return text
 
 
 def clean_text(text):
     """Cleans and preprocesses extracted text"""
-    try:
-        # Remove excessive whitespace and newlines
-        text = re.sub(r'\s+', ' ', text)
-        # Remove non-printable characters
-        text = re.sub(r'[^\x20-\x7E]', ' ', text)
-        # Replace common PDF artifacts
-        text = re.sub(r'\s*-\s*', '-', text)  # Fix hyphenated words
-        # Remove page numbers and headers/footers
-        text = re.sub(r'\bPage \d+\b', '', text)
-        # Fix quotation marks
-        text = re.sub(r'[\u201C\u201D]', '"', text)
-        text = re.sub(r'[\u2018\u2019]', "'", text)
-        return text.strip()
-    except Exception as e:
-        error_msg = f"Text cleaning failed: {str(e)}"
-        logging.error(error_msg)
-        raise RuntimeError(error_msg)
+    # Fix quotation marks before they are dropped as non-printable
+    text = text.replace('\u201C', '"').replace('\u201D', '"')
+    text = text.replace('\u2018', "'").replace('\u2019', "'")
+    # Remove non-printable characters, excessive whitespace and newlines
+    text = _NONPRINT_RE.sub(' ', text)
+    text = ' '.join(text.split())
+    # Fix hyphenated words
+    text = text.replace(' - ', '-').replace(' -', '-').replace('- ', '-')
+    # Remove page numbers and headers/footers
+    text = _PAGE_RE.sub('', text)
+    return text.strip()
+
+
+def iter_chunks(text_stream, max_chars=DEFAULT_CHUNK_CHARS):
+    """Lazily splits an iterable of text pieces into chunks respecting sentence boundaries"""
+    text = ""
+    pos = 0
+    for piece in text_stream:
+        # Only the unconsumed tail (shorter than max_chars) is carried over
+        text = text[pos:] + piece
+        pos = 0
+        while True:
+            while pos < len(text) and text[pos].isspace():
+                pos += 1
+            if len(text) - pos <= max_chars:
+                break
 
+            # Split after the last sentence boundary within max_chars
+            end = pos + max_chars
+            index = max(text.rfind(boundary, pos + 1, end) for boundary in _SENTENCE_BOUNDARIES)
+            split_index = index + 1 if index != -1 else end
 
-def split_text(text, max_chars=1000):
-    """Splits text into chunks respecting sentence boundaries"""
+            yield text[pos:split_index]
+            pos = split_index
+
+    if pos < len(text):
+        yield text[pos:]
+
+
+def _nonempty(path):
+    """Checks with a single stat call that a file exists and is not empty"""
     try:
-        chunks = []
-        while text:
-            if len(text) <= max_chars:
-                chunks.append(text)
-                break
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
 
-            # Find last sentence boundary within max_chars
-            split_index = max_chars
-            for boundary in ['.', '!', '?', ';', '\n', '。', '！', '？', '；']:
-                index = text.rfind(boundary, 0, max_chars)
-                if index > 0:
-                    split_index = index + 1
-                    break
 
-            chunks.append(text[:split_index])
-            text = text[split_index:].strip()
+def get_cache_path(chunk, language):
+    """Returns the cache file path for a text chunk in the given language"""
+    key = hashlib.sha256(f"{language}\0{chunk}".encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{key}.mp3"
 
-        return chunks
-    except Exception as e:
-        error_msg = f"Text splitting failed: {str(e)}"
-        logging.error(error_msg)
-        raise RuntimeError(error_msg)
 
+def prune_cache(max_bytes=CACHE_MAX_BYTES):
+    """Deletes the least recently used cache files until the cache fits in max_bytes"""
+    try:
+        entries = []
+        # *.part files are writes abandoned by a crashed run
+        for path in itertools.chain(CACHE_DIR.glob("*.mp3"), CACHE_DIR.glob("*.part")):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Renamed or deleted by a concurrent run
+            entries.append((stat.st_mtime, stat.st_size, path))
+    except OSError as e:
+        logging.warning(f"Failed to scan audio cache: {str(e)}")
+        return
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+            total -= size
+        except OSError as e:
+            logging.warning(f"Failed to delete cache file {path}: {str(e)}")
+
+
+def start_mp3_concat(output_file, log_file):
+    """Starts an ffmpeg process that joins MP3 data written to its stdin into output_file without re-encoding"""
+    # ffmpeg's messages go to a file rather than a pipe so a chatty ffmpeg can't stall on a full buffer
+    return subprocess.Popen(
+        [AudioSegment.converter, "-y", "-loglevel", "error", "-f", "mp3", "-i", "pipe:0",
+         "-c", "copy", "-f", "mp3", output_file],
+        stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=log_file
+    )
 
-def convert_text_to_speech(text, output_file, language='en'):
-    """Converts text to speech using gTTS with progress handling"""
+
+def adjust_speed(mp3_path, speed_factor):
+    """Changes the playback speed of an MP3 file in place without altering pitch"""
+    if speed_factor <= 0:
+        raise ValueError(f"Invalid speed factor: {speed_factor}")
+
+    # atempo time-stretches natively inside ffmpeg without shifting pitch, so no
+    # audio is decoded or resampled in Python. A single atempo filter only
+    # accepts factors between 0.5 and 2.0, so larger changes are chained.
+    filters = []
+    while speed_factor > 2.0:
+        filters.append("atempo=2.0")
+        speed_factor /= 2.0
+    while speed_factor < 0.5:
+        filters.append("atempo=0.5")
+        speed_factor /= 0.5
+    filters.append(f"atempo={speed_factor}")
+
+    temp_path = mp3_path + ".tmp"
     try:
-        if not FFMPEG_AVAILABLE:
-            raise RuntimeError("ffmpeg is required but not found. Please install ffmpeg and add it to PATH.")
+        result = subprocess.run(
+            [AudioSegment.converter, "-y", "-loglevel", "error", "-i", mp3_path,
+             "-filter:a", ",".join(filters), "-vn", "-f", "mp3", temp_path],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg atempo failed: {result.stderr.strip()}")
+        os.replace(temp_path, mp3_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
 
-        # Split text into manageable chunks
-        chunks = split_text(text)
-        audio_segments = []
-        temp_files = []  # Keep track of temp files for cleanup
 
-        # Create progress window
-        progress_window = tk.Toplevel()
-        progress_window.title("Processing")
-        progress_window.geometry("400x120")
-        progress_window.resizable(False, False)
-        progress_window.grab_set()
+class ConversionCancelled(Exception):
+    """Raised when a conversion is stopped through its cancel_event"""
 
-        progress_label = tk.Label(progress_window, text="Converting text to speech...")
-        progress_label.pack(pady=10)
 
-        progress = ttk.Progressbar(progress_window, orient="horizontal", length=300, mode="determinate")
-        progress.pack(pady=5)
+def convert_text_to_speech(text, output_file, language='en', progress_callback=None, cancel_event=None,
+                           max_chars=DEFAULT_CHUNK_CHARS):
+    """Converts text to speech using gTTS, reporting progress as progress_callback(percent, status)"""
+    def report(percent, status):
+        if progress_callback:
+            progress_callback(percent, status)
 
-        status_label = tk.Label(progress_window, text="Preparing...")
-        status_label.pack(pady=5)
+    report(0, "Preparing...")
+
+    def _synth(idx, chunk):
+        """Synthesize one chunk (or reuse it from the cache) and return its mp3 data"""
+        cache_path = get_cache_path(chunk, language)
+        try:
+            mp3_data = cache_path.read_bytes()
+        except OSError:
+            mp3_data = b""
+        if mp3_data:
+            # Refresh mtime so recently used entries survive pruning; a read-only
+            # cache is still usable, it just can't record the access
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return mp3_data
 
-        progress_window.update()
+        buffer = io.BytesIO()
+        gTTS(text=chunk, lang=language, slow=False).write_to_fp(buffer)
+        mp3_data = buffer.getvalue()
 
         try:
-            for i, chunk in enumerate(chunks):
-                # Update progress
-                progress_val = int((i / len(chunks)) * 100)
-                progress['value'] = progress_val
-                status_label.config(text=f"Processing chunk {i + 1} of {len(chunks)}...")
-                progress_window.update()
-
-                # Convert text chunk to speech
-                tts = gTTS(text=chunk, lang=language, slow=False)
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as tmp:
-                    temp_file_path = tmp.name
-                    tts.save(temp_file_path)
-                    temp_files.append(temp_file_path)
-
-                # Check if file was created successfully
-                if not os.path.exists(temp_file_path) or os.path.getsize(temp_file_path) == 0:
-                    raise RuntimeError(f"Failed to create temporary audio file: {temp_file_path}")
-
-                audio_segments.append(AudioSegment.from_mp3(temp_file_path))
-
-            # Update progress for combining audio
-            status_label.config(text="Combining audio segments...")
-            progress['value'] = 100
-            progress_window.update()
-
-            # Combine audio segments
-            combined_audio = audio_segments[0]
-            for segment in audio_segments[1:]:
-                combined_audio += segment
-
-            # Export final audio
-            combined_audio.export(output_file, format="mp3")
-
-            # Check if output file was created
-            if not os.path.exists(output_file) or os.path.getsize(output_file) == 0:
-                raise RuntimeError(f"Failed to create output file: {output_file}")
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write under a unique name first so concurrent readers never see a partial file
+            partial_path = cache_path.with_suffix(f".{os.getpid()}.{idx}.part")
+            partial_path.write_bytes(mp3_data)
+            os.replace(partial_path, cache_path)
+        except OSError as e:
+            logging.warning(f"Failed to cache audio chunk: {str(e)}")
+
+        return mp3_data
+
+    ffmpeg = None
+    ffmpeg_log = tempfile.TemporaryFile()
+    # Write to a sibling file so a failed or cancelled run leaves output_file untouched
+    partial_output = output_file + ".part"
+    try:
+        if not FFMPEG_AVAILABLE:
+            raise RuntimeError("ffmpeg is required but not found. Please install ffmpeg and add it to PATH.")
 
-            return True
-        except Exception as e:
-            error_msg = f"Text-to-speech conversion failed: {str(e)}"
-            logging.error(error_msg)
-            raise
-        finally:
-            # Clean up temporary files
-            for temp_file in temp_files:
-                try:
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-                except Exception as e:
-                    logging.warning(f"Failed to delete temp file {temp_file}: {str(e)}")
+        # MP3 data is framed, so chunks can be streamed to ffmpeg back to back
+        ffmpeg = start_mp3_concat(partial_output, ffmpeg_log)
+
+        def _ffmpeg_error():
+            ffmpeg.wait()
+            ffmpeg_log.seek(0)
+            return RuntimeError(f"ffmpeg concat failed: {ffmpeg_log.read().decode(errors='replace').strip()}")
+
+        # gTTS calls are network-bound, so run them concurrently. Chunks are
+        # pulled lazily and at most MAX_TTS_WORKERS are in flight at once,
+        # with results written out in their original order.
+        pending = collections.deque()
+        # Repeated chunks share the in-flight future; later repeats hit the disk cache
+        in_flight = {}
+        processed_chunks = 0
+        processed_chars = 0
+
+        def _collect_oldest():
+            nonlocal processed_chunks, processed_chars
+            # Setting cancel_event from another thread aborts the conversion
+            if cancel_event is not None and cancel_event.is_set():
+                raise ConversionCancelled("Conversion cancelled")
+
+            future, chunk = pending.popleft()
+            if in_flight.get(chunk) is future:
+                del in_flight[chunk]
+            mp3_data = future.result()
+            processed_chunks += 1
+
+            # Check if audio was created successfully
+            if not mp3_data:
+                raise RuntimeError(f"No audio returned for chunk {processed_chunks}")
+            try:
+                ffmpeg.stdin.write(mp3_data)
+            except OSError:
+                # BrokenPipeError on POSIX, EINVAL on Windows once ffmpeg has exited
+                raise _ffmpeg_error()
+
+            # Update progress
+            processed_chars += len(chunk)
+            report(int((processed_chars / max(1, len(text))) * 100), f"Processed chunk {processed_chunks}...")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_TTS_WORKERS) as executor:
+            for i, chunk in enumerate(iter_chunks((text,), max_chars)):
+                if len(pending) >= MAX_TTS_WORKERS:
+                    _collect_oldest()
+                future = in_flight.get(chunk)
+                if future is None:
+                    future = in_flight[chunk] = executor.submit(_synth, i, chunk)
+                pending.append((future, chunk))
+            while pending:
+                _collect_oldest()
+
+        # Update progress for combining audio
+        report(100, "Combining audio segments...")
+
+        # Let ffmpeg finish writing the joined MP3
+        try:
+            ffmpeg.stdin.close()
+        except OSError:
+            raise _ffmpeg_error()
+        if ffmpeg.wait() != 0:
+            raise _ffmpeg_error()
+
+        # Check if output file was created
+        if not _nonempty(partial_output):
+            raise RuntimeError(f"Failed to create output file: {output_file}")
+        os.replace(partial_output, output_file)
+        prune_cache()
 
-            progress_window.destroy()
+        return True
+    except ConversionCancelled:
+        raise
     except Exception as e:
         error_msg = f"Text-to-speech conversion failed: {str(e)}"
         logging.error(error_msg)
         raise RuntimeError(error_msg)
+    finally:
+        # Don't leave ffmpeg running if the conversion was aborted
+        if ffmpeg is not None and ffmpeg.poll() is None:
+            ffmpeg.kill()
+            ffmpeg.wait()
+        ffmpeg_log.close()
+        try:
+            if os.path.exists(partial_output):
+                os.remove(partial_output)
+        except OSError as e:
+            logging.warning(f"Failed to delete partial output {partial_output}: {str(e)}")
 
 
-def convert_pdf_to_speech(pdf_path, output_file, language='en'):
+def convert_pdf_to_speech(pdf_path, output_file, language='en', progress_callback=None,
+                          max_chars=DEFAULT_CHUNK_CHARS):
     """Full pipeline: PDF to text to speech"""
     try:
         # Check input file
@@ -220,14 +467,12 @@ def convert_pdf_to_speech(pdf_path, output_file, language='en'):
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
         # Extract and clean text
-        raw_text = extract_text_from_pdf(pdf_path)
-        if not raw_text:
+        cleaned_text = extract_text_from_pdf(pdf_path, clean=True)
+        if not cleaned_text:
             return False, "No text extracted from PDF. The file may be scanned or image-based."
 
-        cleaned_text = clean_text(raw_text)
-
         # Convert to speech
-        convert_text_to_speech(cleaned_text, output_file, language)
+        convert_text_to_speech(cleaned_text, output_file, language, progress_callback, max_chars=max_chars)
         return True, "Conversion successful!"
     except Exception as e:
         error_msg = f"PDF to speech conversion failed: {str(e)}"
@@ -277,12 +522,11 @@ def setup_gui():
                     messagebox.showerror("Error", f"File not found: {file_path}")
                     return
 
-                raw_text = extract_text_from_pdf(file_path)
-                if not raw_text:
+                cleaned_text = extract_text_from_pdf(file_path, clean=True)
+                if not cleaned_text:
                     messagebox.showwarning("Warning", "No text extracted from PDF. The file may be scanned.")
                     return
 
-                cleaned_text = clean_text(raw_text)
                 text_input.delete("1.0", tk.END)
                 text_input.insert(tk.END, cleaned_text)
                 pdf_path_var.set(file_path)
@@ -365,38 +609,113 @@ def setup_gui():
                 messagebox.showerror("Error", f"Failed to create output directory: {str(e)}")
                 return
 
-        # Get language selection
+        # Read options on the Tk thread before handing off to the worker
         language = lang_var.get()
+        speed_factor = speed_var.get()
+        play_after = play_var.get()
 
-        try:
-            # Always use the text from the text widget (which may include user edits)
-            convert_text_to_speech(text, output_path, language)
-            success, message = True, "Conversion successful!"
+        # Create progress window
+        progress_window = tk.Toplevel(root)
+        progress_window.title("Processing")
+        progress_window.geometry("400x150")
+        progress_window.resizable(False, False)
+        progress_window.grab_set()
 
-            # Apply speed adjustment
-            speed_factor = speed_var.get()
-            if speed_factor != 1.0:
+        progress_label = tk.Label(progress_window, text="Converting text to speech...")
+        progress_label.pack(pady=10)
+
+        progress = ttk.Progressbar(progress_window, orient="horizontal", length=300, mode="determinate")
+        progress.pack(pady=5)
+
+        status_label = tk.Label(progress_window, text="Preparing...")
+        status_label.pack(pady=5)
+
+        cancel_event = threading.Event()
+
+        def cancel():
+            cancel_event.set()
+            status_label.config(text="Cancelling...")
+
+        ttk.Button(progress_window, text="Cancel", command=cancel).pack(pady=5)
+        progress_window.protocol("WM_DELETE_WINDOW", cancel)
+
+        # The worker thread never touches Tk widgets; it posts messages here instead
+        messages = queue.Queue()
+        last_progress_time = 0.0
+
+        def post_progress(percent, status):
+            # Throttle progress messages to ~10 Hz; the final stage is always shown
+            nonlocal last_progress_time
+            now = time.monotonic()
+            if percent < 100 and now - last_progress_time < 0.1:
+                return
+            last_progress_time = now
+            messages.put(("progress", percent, status))
+
+        def _worker():
+            try:
+                # Always use the text from the text widget (which may include user edits)
+                convert_text_to_speech(
+                    text, output_path, language,
+                    progress_callback=post_progress,
+                    cancel_event=cancel_event
+                )
+
+                # Apply speed adjustment
+                if speed_factor != 1.0:
+                    messages.put(("progress", 100, "Adjusting playback speed..."))
+                    try:
+                        adjust_speed(output_path, speed_factor)
+                    except Exception as e:
+                        messages.put(("warning", f"Speed adjustment failed: {str(e)}"))
+
+                messages.put(("done", "Conversion successful!"))
+            except ConversionCancelled:
+                messages.put(("cancelled",))
+            except Exception as e:
+                messages.put(("error", str(e)))
+
+        def _drain_queue():
+            latest_progress = None
+            while True:
                 try:
-                    audio = AudioSegment.from_mp3(output_path)
-                    new_sample_rate = int(audio.frame_rate * speed_factor)
-                    adjusted_audio = audio._spawn(audio.raw_data, overrides={
-                        'frame_rate': new_sample_rate
-                    })
-                    adjusted_audio = adjusted_audio.set_frame_rate(audio.frame_rate)
-                    adjusted_audio.export(output_path, format="mp3")
-                except Exception as e:
-                    messagebox.showwarning("Speed Adjustment", f"Speed adjustment failed: {str(e)}")
-
-            messagebox.showinfo("Success", f"{message}\nFile saved to: {output_path}")
-            if play_var.get():
-                if sys.platform == 'win32':
-                    os.startfile(output_path)  # Windows
-                elif sys.platform == 'darwin':
-                    subprocess.call(('open', output_path))  # macOS
-                else:
-                    subprocess.call(('xdg-open', output_path))  # Linux
-        except Exception as e:
-            messagebox.showerror("Error", f"Conversion failed: {str(e)}")
+                    kind, *args = messages.get_nowait()
+                except queue.Empty:
+                    break
+
+                if kind == "progress":
+                    # Only the newest progress matters; skip redrawing stale values
+                    latest_progress = args
+                elif kind == "warning":
+                    messagebox.showwarning("Speed Adjustment", args[0])
+                elif kind == "cancelled":
+                    progress_window.destroy()
+                    return
+                elif kind == "error":
+                    progress_window.destroy()
+                    messagebox.showerror("Error", f"Conversion failed: {args[0]}")
+                    return
+                elif kind == "done":
+                    progress_window.destroy()
+                    messagebox.showinfo("Success", f"{args[0]}\nFile saved to: {output_path}")
+                    if play_after:
+                        if sys.platform == 'win32':
+                            os.startfile(output_path)  # Windows
+                        elif sys.platform == 'darwin':
+                            subprocess.call(('open', output_path))  # macOS
+                        else:
+                            subprocess.call(('xdg-open', output_path))  # Linux
+                    return
+
+            if latest_progress is not None:
+                percent, status = latest_progress
+                progress['value'] = percent
+                if not cancel_event.is_set():
+                    status_label.config(text=status)
+            root.after(100, _drain_queue)
+
+        threading.Thread(target=_worker, daemon=True).start()
+        root.after(100, _drain_queue)
 
     ttk.Button(button_frame, text="Convert to Audiobook", command=generate_speech,
                style='TButton').pack(pady=10)
@@ -444,7 +763,11 @@ def main_cli():
     parser.add_argument("output_file", help="Output MP3 file path")
     parser.add_argument("-l", "--lang", default="en", help="Language code (default: en)")
     parser.add_argument("-s", "--speed", type=float, default=1.0, help="Playback speed (0.5 to 2.0, default: 1.0)")
+    parser.add_argument("-c", "--chunk-chars", type=int, default=DEFAULT_CHUNK_CHARS,
+                        help=f"Maximum characters per synthesized chunk (default: {DEFAULT_CHUNK_CHARS})")
     args = parser.parse_args()
+    if args.chunk_chars < 1:
+        parser.error("--chunk-chars must be at least 1")
 
     # Check input file
     if not os.path.exists(args.pdf_file):
@@ -461,20 +784,20 @@ def main_cli():
             return
 
     print("Extracting text from PDF...")
-    success, message = convert_pdf_to_speech(args.pdf_file, args.output_file, args.lang)
+    with tqdm(total=100, unit="%", bar_format="{l_bar}{bar}| {n:.0f}/{total}%{postfix}") as progress_bar:
+        def update_progress(percent, status):
+            progress_bar.set_postfix_str(status)
+            progress_bar.update(percent - progress_bar.n)
+
+        success, message = convert_pdf_to_speech(args.pdf_file, args.output_file, args.lang,
+                                                 progress_callback=update_progress, max_chars=args.chunk_chars)
 
     if success:
         # Apply speed adjustment if needed
         if args.speed != 1.0:
             try:
                 print("Adjusting playback speed...")
-                audio = AudioSegment.from_mp3(args.output_file)
-                new_sample_rate = int(audio.frame_rate * args.speed)
-                adjusted_audio = audio._spawn(audio.raw_data, overrides={
-                    'frame_rate': new_sample_rate
-                })
-                adjusted_audio = adjusted_audio.set_frame_rate(audio.frame_rate)
-                adjusted_audio.export(args.output_file, format="mp3")
+                adjust_speed(args.output_file, args.speed)
             except Exception as e:
                 print(f"Warning: Speed adjustment failed: {str(e)}")
 
@@ -485,6 +808,8 @@ def main_cli():
 
 
 if __name__ == "__main__":
+    # Let frozen Windows builds hand spawned extraction workers to multiprocessing
+    multiprocessing.freeze_support()
     # Run in CLI mode if arguments are passed, otherwise run GUI
     if len(sys.argv) > 1:
         main_cli()